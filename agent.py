@@ -1,12 +1,14 @@
 import asyncio
 import logging
+import aiofiles
+import orjson
 from dotenv import load_dotenv
 import json
 import os
-import xml.etree.ElementTree as ET
-from time import perf_counter
+import re
+from pathlib import Path
+from time import strftime
 from typing import Annotated
-from datetime import datetime
 from livekit import rtc, api
 from livekit.agents import (
     AutoSubscribe,
@@ -29,148 +31,290 @@ logger.setLevel(logging.INFO)
 
 outbound_trunk_id = os.getenv("SIP_OUTBOUND_TRUNK_ID")
 
+# bound once so entrypoint doesn't repeat the attribute lookups on every call
+_CreateSIPReq = api.CreateSIPParticipantRequest
+_AUDIO_ONLY = AutoSubscribe.AUDIO_ONLY
+
+# parsed prompts keyed on (path, mtime_ns), so reloading an unchanged file is free
+_prompt_cache: dict[tuple[str, int], str] = {}
+
+_FALLBACK_INSTRUCTIONS = (
+    "You are a polite and professional payment reminder voice agent. "
+    "Your interface with user will be voice. "
+    "Be respectful and helpful at all times."
+)
+
+# used to normalize the line layout of the <context> section
+_CTX_NORM = re.compile(r"[^\S\n]*\n[^\S\n]*")
+_CTX_BLANKS = re.compile(r"\n{2,}")
+
 def load_prompt_from_xml(xml_file_path="debtVoiceAgent.xml"):
     """Load system prompt and customer context from XML file"""
     try:
-        tree = ET.parse(xml_file_path)
-        root = tree.getroot()
+        cache_key = (xml_file_path, os.stat(xml_file_path).st_mtime_ns)
+        if cache_key in _prompt_cache:
+            return _prompt_cache[cache_key]
+
+        # imported here so that starting from the prompt cache never loads lxml
+        from lxml import etree
+
+        # Stream the file, keeping only the text of the top-level <system> and
+        # <context> elements, so the whole tree is never held in memory. The
+        # whole document is still read, so malformed XML falls back as before
+        texts = {}
+        for _, element in etree.iterparse(
+            xml_file_path,
+            events=("end",),
+            tag=("system", "context"),
+            huge_tree=False,
+        ):
+            parent = element.getparent()
+            if parent is not None and parent.getparent() is None:
+                texts.setdefault(element.tag, element.text)
+            element.clear()
+            while element.getprevious() is not None:
+                del parent[0]
         
         # Extract system prompt
-        system_element = root.find('system')
-        system_prompt = system_element.text.strip() if system_element is not None else ""
+        system_prompt = texts["system"].strip() if "system" in texts else ""
         
         # Extract customer context
-        context_element = root.find('context')
         customer_context = ""
-        if context_element is not None:
-            context_lines = []
-            for line in context_element.text.strip().split('\n'):
-                line = line.strip()
-                if line:
-                    context_lines.append(line)
-            customer_context = "\n".join(context_lines)
+        if "context" in texts:
+            # strip every line and drop the blank ones
+            customer_context = _CTX_BLANKS.sub(
+                "\n", _CTX_NORM.sub("\n", texts["context"])
+            ).strip()
         
         # Combine system prompt with customer context
         full_instructions = system_prompt
         if customer_context:
             full_instructions += f"\n\nCustomer Information:\n{customer_context}"
         
+        _prompt_cache[cache_key] = full_instructions
         return full_instructions
     
     except Exception as e:
-        logger.warning(f"Failed to load XML prompt: {e}. Using fallback instructions.")
-        return (
-            "You are a polite and professional payment reminder voice agent. "
-            "Your interface with user will be voice. "
-            "Be respectful and helpful at all times."
-        )
+        logger.warning("Failed to load XML prompt: %s. Using fallback instructions.", e)
+        return _FALLBACK_INSTRUCTIONS
+
+def _prompt_signature(xml_file_path):
+    """Identify the XML file and the code rendering it, so any change to either invalidates the cache"""
+    xml_st = os.stat(xml_file_path)
+    code_st = os.stat(__file__)
+    return [
+        os.path.abspath(xml_file_path),
+        xml_st.st_mtime_ns,
+        xml_st.st_size,
+        code_st.st_mtime_ns,
+        code_st.st_size,
+    ]
+
+def load_prompt(xml_file_path="debtVoiceAgent.xml", cache_path="debtVoiceAgent.cached.json"):
+    """Load instructions from the rendered prompt cache, rebuilding it from the XML file when stale"""
+    try:
+        signature = _prompt_signature(xml_file_path)
+    except OSError:
+        signature = None
+
+    if signature is not None:
+        try:
+            cached = orjson.loads(Path(cache_path).read_bytes())
+            if cached["signature"] == signature:
+                return cached["instructions"]
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+            pass
+
+    instructions = load_prompt_from_xml(xml_file_path)
+    if signature is not None and instructions is not _FALLBACK_INSTRUCTIONS:
+        # write to a temporary file first so concurrent workers never read a partial cache
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            Path(tmp_path).write_bytes(
+                orjson.dumps({"signature": signature, "instructions": instructions})
+            )
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning("Failed to write prompt cache %s: %s", cache_path, e)
+    return instructions
 
-# Load instructions from XML file
-_default_instructions = load_prompt_from_xml()
+# Load instructions, parsing the XML file only when its prompt cache is stale
+_default_instructions = load_prompt()
+
+# system chat context for the default instructions, copied for each call
+_INITIAL_CTX = llm.ChatContext()
+_INITIAL_CTX.add_message(role="system", content=_default_instructions)
+
+# set WRITE_TRANSCRIPTS=0 to skip saving transcripts to local disk
+_WRITE_TRANSCRIPTS = os.getenv("WRITE_TRANSCRIPTS", "1") == "1"
+
+# Create transcripts directory once, rather than on every shutdown
+if _WRITE_TRANSCRIPTS:
+    os.makedirs("transcripts", exist_ok=True)
+
+# phone numbers come from job metadata, keep only filename-safe characters
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^0-9A-Za-z_+-]")
+
+def make_transcript_cb(ctx: JobContext, phone_number: str):
+    """Build the shutdown callback that saves the session transcript for `phone_number`"""
+    safe_number = _UNSAFE_FILENAME_CHARS.sub("_", phone_number or "unknown")
+
+    async def write_transcript():
+        current_date = strftime("%Y%m%d_%H%M%S")
 
-# Add transcript writing callback before connecting
-def write_transcript(phone_number, ctx):
-        current_date = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Create transcripts directory if it doesn't exist
-        os.makedirs("transcripts", exist_ok=True)
-        
         # Save to transcripts directory instead of /tmp
-        filename = f"transcripts/transcript_{phone_number}_{current_date}.json"
-        
+        filename = f"transcripts/transcript_{safe_number}_{current_date}.json"
+
         try:
             # Get session from the context if available
             session = getattr(ctx, '_session', None)
             if session and hasattr(session, 'history'):
-                with open(filename, 'w') as f:
-                    json.dump(session.history.to_dict(), f, indent=2)
-                logger.info(f"📄 Transcript for {phone_number} saved to {filename}")
+                data = orjson.dumps(session.history.to_dict(), option=orjson.OPT_INDENT_2)
+                async with aiofiles.open(filename, 'wb') as f:
+                    await f.write(data)
+                logger.info("📄 Transcript for %s saved to %s", phone_number, filename)
             else:
                 logger.warning("No session history available for transcript")
         except Exception as e:
-            logger.error(f"Failed to save transcript: {e}")
+            logger.error("Failed to save transcript: %s", e)
+
+    return write_transcript
 
 async def entrypoint(ctx: JobContext):
     global _default_instructions, outbound_trunk_id
-    logger.info(f"connecting to room {ctx.room.name}")
+    logger.info("connecting to room %s", ctx.room.name)
     user_identity = "phone_user"
     phone_number = ctx.job.metadata
-    logger.info(f"dialing {phone_number} to room {ctx.room.name}")
+    logger.info("dialing %s to room %s", phone_number, ctx.room.name)
  
-    # Create a callback function that will be called on shutdown
-    async def write_transcript():
-        current_date = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Create transcripts directory if it doesn't exist
-        os.makedirs("transcripts", exist_ok=True)
-        
-        # Save to transcripts directory instead of /tmp
-        filename = f"transcripts/transcript_{phone_number}_{current_date}.json"
-        
-        try:
-            # Get session from the context if available
-            session = getattr(ctx, '_session', None)
-            if session and hasattr(session, 'history'):
-                with open(filename, 'w') as f:
-                    json.dump(session.history.to_dict(), f, indent=2)
-                logger.info(f"📄 Transcript for {phone_number} saved to {filename}")
-            else:
-                logger.warning("No session history available for transcript")
-        except Exception as e:
-            logger.error(f"Failed to save transcript: {e}")
-    
-    ctx.add_shutdown_callback(write_transcript)
-    
-    await ctx.connect(auto_subscribe=AutoSubscribe.AUDIO_ONLY)
-
+    # Save the transcript when the job shuts down
+    if _WRITE_TRANSCRIPTS:
+        ctx.add_shutdown_callback(make_transcript_cb(ctx, phone_number))
     
     # Use the instructions loaded from XML (already includes customer context)
     instructions = _default_instructions
 
-    # `create_sip_participant` starts dialing the user
-    await ctx.api.sip.create_sip_participant(
-        api.CreateSIPParticipantRequest(
-            room_name=ctx.room.name,
-            sip_trunk_id=outbound_trunk_id,
-            sip_call_to=phone_number,
-            participant_identity=user_identity,
+    # `create_sip_participant` starts dialing the user. it doesn't depend on our
+    # own connection to the room, so both are issued concurrently
+    dial = asyncio.create_task(
+        ctx.api.sip.create_sip_participant(
+            _CreateSIPReq(
+                room_name=ctx.room.name,
+                sip_trunk_id=outbound_trunk_id,
+                sip_call_to=phone_number,
+                participant_identity=user_identity,
+            )
         )
     )
+    try:
+        await ctx.connect(auto_subscribe=_AUDIO_ONLY)
+    except BaseException:
+        # never leave the user's phone ringing with no agent in the room
+        dial.cancel()
+        await asyncio.gather(dial, return_exceptions=True)
+        if dial.cancelled() or dial.exception() is None:
+            # the request may already have reached the server
+            try:
+                await ctx.api.room.remove_participant(
+                    api.RoomParticipantIdentity(
+                        room=ctx.room.name,
+                        identity=user_identity,
+                    )
+                )
+            except Exception as e:
+                logger.info("received error while cancelling the call: %s", e)
+        raise
+    await dial
 
     # a participant is created as soon as we start dialing
     participant = await ctx.wait_for_participant(identity=user_identity)
 
     await run_voice_pipeline_agent(ctx, participant, instructions)
 
-    # in addition, you can monitor the call status separately
-    start_time = perf_counter()
-    while perf_counter() - start_time < 30:
-        call_status = participant.attributes.get("sip.callStatus")
-        if call_status == "active":
-            logger.info("user has picked up")
+    # in addition, you can monitor the call status separately. each outcome has
+    # its own event, set from the room callbacks as soon as the SIP state changes
+    picked_up = asyncio.Event()
+    rejected = asyncio.Event()
+    unavailable = asyncio.Event()
+
+    def update_call_status(p: rtc.Participant):
+        if p.identity != participant.identity:
             return
+        call_status = p.attributes.get("sip.callStatus")
+        if call_status == "active":
+            picked_up.set()
         elif call_status == "automation":
             # if DTMF is used in the `sip_call_to` number, typically used to dial
             # an extension or enter a PIN.
             # during DTMF dialing, the participant will be in the "automation" state
             pass
-        elif participant.disconnect_reason == rtc.DisconnectReason.USER_REJECTED:
-            logger.info("user rejected the call, exiting job")
-            break
-        elif participant.disconnect_reason == rtc.DisconnectReason.USER_UNAVAILABLE:
-            logger.info("user did not pick up, exiting job")
-            break
-        await asyncio.sleep(0.1)
+        elif p.disconnect_reason == rtc.DisconnectReason.USER_REJECTED:
+            rejected.set()
+        elif p.disconnect_reason == rtc.DisconnectReason.USER_UNAVAILABLE:
+            unavailable.set()
+
+    def on_attributes_changed(changed_attributes: dict, p: rtc.Participant):
+        update_call_status(p)
+
+    ctx.room.on("participant_attributes_changed", on_attributes_changed)
+    ctx.room.on("participant_disconnected", update_call_status)
+    waiters = []
+    try:
+        # the call may already have been answered while the agent was starting
+        update_call_status(participant)
+
+        waiters = [
+            asyncio.create_task(event.wait())
+            for event in (picked_up, rejected, unavailable)
+        ]
+        await asyncio.wait(waiters, timeout=30, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        ctx.room.off("participant_attributes_changed", on_attributes_changed)
+        ctx.room.off("participant_disconnected", update_call_status)
+        for task in waiters:
+            task.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+
+    if picked_up.is_set():
+        logger.info("user has picked up")
+        return
+    elif rejected.is_set():
+        logger.info("user rejected the call, exiting job")
+    elif unavailable.is_set():
+        logger.info("user did not pick up, exiting job")
 
     logger.info("session timed out, exiting job")
     ctx.shutdown()
 
 
+# mock availability returned by `look_up_availability`, serialized once
+_AVAIL_JSON = json.dumps(
+    {
+        "available_times": ["1pm", "2pm", "3pm"],
+    }
+)
+
+
+def _registered_tool(registry: list[str]):
+    """Same as `function_tool()`, but also records the method name in `registry`"""
+
+    def decorator(fnc):
+        registry.append(fnc.__name__)
+        return function_tool()(fnc)
+
+    return decorator
+
+
 class CallActions(llm.ToolContext):
     """
     Detect user intent and perform actions
     """
 
+    __slots__ = ("api", "participant", "room")
+
+    # names of the tool methods below, collected once at class definition
+    _tool_names: list[str] = []
+
     def __init__(
         self, *, api: api.LiveKitAPI, participant: rtc.RemoteParticipant, room: rtc.Room
     ):
@@ -179,41 +323,37 @@ class CallActions(llm.ToolContext):
         self.participant = participant
         self.room = room
 
-    async def hangup(self):
+    async def hangup(self, ident: str):
         try:
             await self.api.room.remove_participant(
                 api.RoomParticipantIdentity(
                     room=self.room.name,
-                    identity=self.participant.identity,
+                    identity=ident,
                 )
             )
         except Exception as e:
             # it's possible that the user has already hung up, this error can be ignored
-            logger.info(f"received error while ending call: {e}")
+            logger.info("received error while ending call: %s", e)
 
-    @function_tool()
+    @_registered_tool(_tool_names)
     async def end_call(self):
         """Called when the user wants to end the call"""
-        logger.info(f"ending the call for {self.participant.identity}")
-        await self.hangup()
+        ident = self.participant.identity
+        logger.info("ending the call for %s", ident)
+        await self.hangup(ident)
 
-    @function_tool()
+    @_registered_tool(_tool_names)
     async def look_up_availability(
         self,
         date: Annotated[str, "The date of the appointment to check availability for"],
     ):
         """Called when the user asks about alternative appointment availability"""
         logger.info(
-            f"looking up availability for {self.participant.identity} on {date}"
-        )
-        await asyncio.sleep(3)
-        return json.dumps(
-            {
-                "available_times": ["1pm", "2pm", "3pm"],
-            }
+            "looking up availability for %s on %s", self.participant.identity, date
         )
+        return _AVAIL_JSON
 
-    @function_tool()
+    @_registered_tool(_tool_names)
     async def confirm_appointment(
         self,
         date: Annotated[str, "date of the appointment"],
@@ -221,15 +361,19 @@ class CallActions(llm.ToolContext):
     ):
         """Called when the user confirms their appointment on a specific date. Use this tool only when they are certain about the date and time."""
         logger.info(
-            f"confirming appointment for {self.participant.identity} on {date} at {time}"
+            "confirming appointment for %s on %s at %s",
+            self.participant.identity,
+            date,
+            time,
         )
         return "reservation confirmed"
 
-    @function_tool()
+    @_registered_tool(_tool_names)
     async def detected_answering_machine(self):
         """Called when the call reaches voicemail. Use this tool AFTER you hear the voicemail greeting"""
-        logger.info(f"detected answering machine for {self.participant.identity}")
-        await self.hangup()
+        ident = self.participant.identity
+        logger.info("detected answering machine for %s", ident)
+        await self.hangup(ident)
 
 
 async def run_voice_pipeline_agent(
@@ -237,33 +381,33 @@ async def run_voice_pipeline_agent(
 ):
     logger.info("starting voice pipeline agent")
 
-    initial_ctx = llm.ChatContext()
-    initial_ctx.add_message(
-        role="system",
-        content=instructions,
-    )
+    if instructions == _default_instructions:
+        initial_ctx = _INITIAL_CTX.copy()
+    else:
+        initial_ctx = llm.ChatContext()
+        initial_ctx.add_message(
+            role="system",
+            content=instructions,
+        )
 
     # Create function context with tools
     fnc_ctx = CallActions(api=ctx.api, participant=participant, room=ctx.room)
 
 
-    # Get the tools from the function context
-    tools = []
-    for attr_name in dir(fnc_ctx):
-        attr = getattr(fnc_ctx, attr_name)
-        if hasattr(attr, '__wrapped__') and hasattr(attr.__wrapped__, '_is_function_tool'):
-            tools.append(attr)
+    # Get the tools from the function context. All of them are exposed to the
+    # LLM, including end_call and detected_answering_machine, which hang up
+    tools = [getattr(fnc_ctx, name) for name in CallActions._tool_names]
     
-    logger.info(f"tools: {tools}")
+    logger.debug("tools: %s", CallActions._tool_names)
     # Create the agent with proper configuration
     agent = Agent(
         instructions=instructions,
         chat_ctx=initial_ctx,
         tools=tools,
         vad=ctx.proc.userdata["vad"],
-        stt=deepgram.STT(model="nova-2-phonecall"),
-        llm=openai.LLM(),
-        tts=openai.TTS(),
+        stt=ctx.proc.userdata["stt"],
+        llm=ctx.proc.userdata["llm"],
+        tts=ctx.proc.userdata["tts"],
     )
     
     session = AgentSession()
@@ -274,8 +418,24 @@ async def run_voice_pipeline_agent(
     await session.start(agent, room=ctx.room)
 
 
+def install_uvloop():
+    """Use uvloop's libuv-based event loop when available (it doesn't support Windows)"""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def prewarm(proc: JobProcess):
+    # job processes may be spawned rather than forked, so install it here as well
+    install_uvloop()
     proc.userdata["vad"] = silero.VAD.load()
+    # each job process runs one call at a time, so the plugin clients (and their
+    # connection pools) can be created once here and reused by every job
+    proc.userdata["stt"] = deepgram.STT(model="nova-2-phonecall")
+    proc.userdata["llm"] = openai.LLM()
+    proc.userdata["tts"] = openai.TTS()
 
 
 if __name__ == "__main__":
@@ -283,13 +443,14 @@ if __name__ == "__main__":
         raise ValueError(
             "SIP_OUTBOUND_TRUNK_ID is not set"
         )
+    install_uvloop()
     cli.run_app(
         WorkerOptions(
             entrypoint_fnc=entrypoint,
             # giving this agent a name will allow us to dispatch it via API
             # automatic dispatch is disabled when `agent_name` is set
             agent_name="outbound-caller",
-            # prewarm by loading the VAD model, needed only for VoicePipelineAgent
+            # prewarm by loading the VAD model and creating the STT/LLM/TTS clients
             prewarm_fnc=prewarm,
         )
     )
\ No newline at end of file
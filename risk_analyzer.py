@@ -17,16 +17,44 @@ Supports:
 - Romanized Hindi (Hinglish)
 - Mixed language conversations
 - Cultural context-aware risk assessment
+
+Optional speedups, used when installed:
+- pyahocorasick for keyword matching (falls back to regular expressions)
+- orjson for reading transcripts (falls back to json)
+- ijson for streaming very large transcripts item by item
+- numba for compiling the risk scoring kernel, only with RISK_ANALYZER_NUMBA=1
 """
 
 import json
 import os
+import io
 import re
+import unicodedata
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Tuple, Any
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Any
+from dataclasses import asdict, dataclass
 from enum import Enum
 
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:  # fall back to precompiled regular expressions
+    ahocorasick = None
+
+try:
+    import ijson
+except ImportError:  # load whole transcripts instead of streaming them
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # fall back to the standard library parser
+    orjson = None
+
 class RiskLevel(Enum):
     LOW = "Low"
     MEDIUM = "Medium"
@@ -44,122 +72,519 @@ class RiskAnalysis:
     transcript_file: str
     analysis_timestamp: str
 
+@dataclass
+class UserMessages:
+    """User side of a transcript, stored as parallel arrays (one entry per message)"""
+    contents: List[str]
+    wordsets: List[frozenset]  # romanized words, punctuation stripped
+    interrupted: np.ndarray  # bool
+    confidence: np.ndarray  # float64, transcript confidence
+    token_counts: np.ndarray  # int32, whitespace-separated words
+
+    def __len__(self) -> int:
+        return len(self.contents)
+
+# Risk indicators - keywords that suggest different risk levels
+# English keywords
+_HIGH_RISK_KEYWORDS = (
+    "can't pay", "no money", "broke", "unemployed", "lost job",
+    "bankruptcy", "lawyer", "dispute", "wrong", "not mine",
+    "never received", "scam", "harassment", "sue", "court",
+    "refuse", "won't pay", "can't afford", "financial hardship",
+    # Hindi keywords (Devanagari)
+    "पैसे नहीं", "पैसा नहीं", "बेरोजगार", "नौकरी नहीं", "गलत", "मेरा नहीं",
+    "नहीं मिला", "धोखा", "गलत नंबर", "वकील", "अदालत", "केस", "मना करता",
+    # Romanized Hindi/Hinglish
+    "paisa nahi", "paise nahi", "berozgar", "naukri nahi", "galat hai",
+    "mera nahi", "nahi mila", "dhoka", "galat number", "vakeel", "adalat",
+    "case karunga", "mana karta", "afford nahi kar sakta",
+    "paisa khatam", "financial problem", "court jaaunga", "lawyer se baat"
+)
+
+_MEDIUM_RISK_KEYWORDS = (
+    "difficult", "tight", "struggling", "need time", "extension",
+    "payment plan", "partial", "later", "next month", "busy",
+    "forgot", "remind me", "will try", "maybe", "not sure",
+    # Hindi keywords (Devanagari)
+    "मुश्किल", "परेशानी", "समय चाहिए", "भूल गया", "बाद में", "अगले महीने",
+    "व्यस्त", "कोशिश करूंगा", "शायद", "पता नहीं", "थोड़ा समय",
+    # Romanized Hindi/Hinglish
+    "mushkil", "pareshani", "samay chahiye", "bhul gaya", "baad mein",
+    "agle mahine", "vyast", "busy hun", "koshish karunga", "shayad",
+    "pata nahi", "thoda samay", "time chahiye", "extension chahiye",
+    "partial payment", "installment mein", "emi mein"
+)
+
+_LOW_RISK_KEYWORDS = (
+    "yes", "okay", "sure", "will pay", "today", "tomorrow",
+    "understand", "sorry", "apologize", "thank you", "appreciate",
+    "payment", "pay now", "confirm", "agreed", "right away",
+    # Hindi keywords (Devanagari)
+    "हाँ", "ठीक", "समझ गया", "माफ़ करो", "धन्यवाद", "शुक्रिया", "सही",
+    "आज", "कल", "अभी", "तुरंत", "पेमेंट", "भुगतान", "देता हूँ",
+    # Romanized Hindi/Hinglish
+    "haan", "theek", "theek hai", "samjh gaya", "maaf karo", "dhanyawad",
+    "shukriya", "sahi", "aaj", "kal", "abhi", "turant",
+    "payment kar dunga", "paisa de dunga", "bhugtan", "pay kar dunga",
+    "samay pe dunga", "bilkul", "zaroor"
+)
+
+_COOPERATION_INDICATORS = (
+    "thank you", "sorry", "understand", "appreciate", "yes",
+    "okay", "sure", "will do", "agreed", "right",
+    # Hindi/Hinglish cooperation indicators
+    "haan", "theek", "theek hai", "samjh gaya", "maaf karo", "shukriya",
+    "dhanyawad", "bilkul", "zaroor", "kar dunga", "de dunga", "samjha",
+    "acha", "sahi", "ठीक", "हाँ", "समझ गया", "माफ़ करो", "धन्यवाद",
+    "शुक्रिया", "बिल्कुल", "जरूर", "अच्छा", "सही"
+)
+
+_NON_COOPERATION_INDICATORS = (
+    "no", "can't", "won't", "refuse", "busy", "later", "maybe",
+    "not now", "call back", "don't have time", "not interested",
+    # Hindi/Hinglish non-cooperation indicators
+    "nahi", "nahin", "mana", "vyast", "baad mein", "phone rakh",
+    "time nahi", "interested nahi", "pareshaan mat karo", "tang mat karo",
+    "नहीं", "मना", "व्यस्त", "बाद में", "फोन रख", "समय नहीं", "परेशान मत करो",
+    "तंग मत करो", "later call karo", "abhi nahi"
+)
+
+# Enhanced sentiment analysis for Hindi/Hinglish
+_POSITIVE_WORDS = (
+    # English positive words
+    "thank", "sorry", "appreciate", "understand", "yes", "okay", "good", "fine",
+    "great", "excellent", "wonderful", "happy", "pleased", "satisfied",
+    # Hindi/Hinglish positive words (Romanized)
+    "dhanyawad", "shukriya", "maaf karo", "samjh gaya", "theek", "acha", "badhiya",
+    "khushi", "santushti", "prasanna", "haan", "bilkul", "zaroor", "accha",
+    "sahi", "badiya", "mast", "sundar", "samjha", "theek hai",
+    # Hindi positive words (Devanagari)
+    "धन्यवाद", "शुक्रिया", "माफ़ करो", "समझ गया", "ठीक", "अच्छा", "बढ़िया",
+    "खुशी", "संतुष्टि", "प्रसन्न", "हाँ", "बिल्कुल", "जरूर", "सही"
+)
+
+_NEGATIVE_WORDS = (
+    # English negative words
+    "no", "can't", "won't", "angry", "upset", "wrong", "bad", "hate", "refuse",
+    "terrible", "awful", "horrible", "disgusted", "furious", "annoyed",
+    # Hindi/Hinglish negative words (Romanized)
+    "nahi", "nahin", "gussa", "pareshaan", "galat", "bura", "nafrat", "mana",
+    "tang", "irritate", "problem", "mushkil", "takleef", "dukh", "ghussa",
+    "pareshan", "khafa", "chid", "badtameez", "bakwas",
+    # Hindi negative words (Devanagari)
+    "नहीं", "गुस्सा", "परेशान", "गलत", "बुरा", "नफरत", "मना", "तंग",
+    "समस्या", "मुश्किल", "तकलीफ", "दुःख", "खफा", "चिढ़", "बदतमीज", "बकवास"
+)
+
+# Common evasive Hinglish phrases
+_EVASIVE_PHRASES = (
+    "abhi busy hun", "time nahi hai", "baad mein call karo",
+    "pareshaan mat karo", "tang mat karo", "galat number hai",
+    "mujhe pata nahi", "kuch nahi pata", "samjh nahi aaya"
+)
+
+# Aggressive/hostile Hinglish patterns
+_HOSTILE_PHRASES = (
+    "phone rakh", "bakwas mat karo", "jhooth bol rahe ho",
+    "scam hai ye", "fraud company", "police complaint karunga"
+)
+
+# Financial distress Hinglish indicators
+_DISTRESS_PHRASES = (
+    "paisa nahi hai", "afford nahi kar sakta", "salary nahi aayi",
+    "job chali gayi", "business band ho gaya", "EMI bhi nahi de pa raha"
+)
+
+# Common words used to tell Hindi from English messages
+_HINDI_WORDS = frozenset(["nahi", "hai", "kar", "se", "mein", "ko", "ka", "ki", "ke"])
+_ENGLISH_WORDS = frozenset(["the", "and", "is", "are", "can", "will", "have", "not"])
+# Language indicator words are romanized, so punctuation must not stick to them ("nahi," or "hai?")
+_LATIN_WORD = re.compile(r"[a-z]+")
+
+def _normalize_text(text: str) -> str:
+    """Lowercase and NFC-normalize text, so Devanagari from any ASR engine compares equal to the keywords"""
+    return unicodedata.normalize('NFC', text.lower())
+
+def _normalize_keywords(keywords: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(_normalize_text(keyword) for keyword in keywords)
+
+# Keyword lists in the same form as ingested content
+_KEYWORD_LISTS = {
+    'high': _normalize_keywords(_HIGH_RISK_KEYWORDS),
+    'medium': _normalize_keywords(_MEDIUM_RISK_KEYWORDS),
+    'low': _normalize_keywords(_LOW_RISK_KEYWORDS),
+    'coop': _normalize_keywords(_COOPERATION_INDICATORS),
+    'non_coop': _normalize_keywords(_NON_COOPERATION_INDICATORS),
+    'positive': _normalize_keywords(_POSITIVE_WORDS),
+    'negative': _normalize_keywords(_NEGATIVE_WORDS),
+    'evasive': _normalize_keywords(_EVASIVE_PHRASES),
+    'hostile': _normalize_keywords(_HOSTILE_PHRASES),
+    'distress': _normalize_keywords(_DISTRESS_PHRASES),
+}
+
+# Hindi keywords translated to English for better report readability
+_REPORT_TRANSLATIONS = {
+    "पैसे नहीं": "no money",
+    "पैसा नहीं": "no money", 
+    "बेरोजगार": "unemployed",
+    "नौकरी नहीं": "no job",
+    "गलत": "wrong",
+    "मेरा नहीं": "not mine",
+    "नहीं मिला": "never received",
+    "धोखा": "fraud/scam",
+    "वकील": "lawyer",
+    "अदालत": "court",
+    "केस": "case",
+    "मुश्किल": "difficult",
+    "परेशानी": "problem/trouble",
+    "समय चाहिए": "need time",
+    "भूल गया": "forgot",
+    "बाद में": "later",
+    "व्यस्त": "busy",
+    "हाँ": "yes",
+    "ठीक": "okay",
+    "समझ गया": "understood",
+    "माफ़ करो": "sorry",
+    "धन्यवाद": "thank you",
+    "शुक्रिया": "thank you",
+    "नहीं": "no",
+    "गुस्सा": "angry",
+    "परेशान": "upset/troubled"
+}
+_REPORT_TRANSLATIONS = {_normalize_text(keyword): name for keyword, name in _REPORT_TRANSLATIONS.items()}
+
+# Report name of every keyword, aligned with its category list so matched
+# positions map straight to what the report shows
+_REPORT_NAMES = {
+    category: tuple(_REPORT_TRANSLATIONS.get(keyword, keyword) for keyword in keywords)
+    for category, keywords in _KEYWORD_LISTS.items()
+}
+
+def _index_keywords(keyword_lists: Dict[str, Tuple[str, ...]]) -> Dict[str, Dict[str, int]]:
+    """Map each keyword to its position in every category list it belongs to"""
+    positions: Dict[str, Dict[str, int]] = {}
+    for category, keywords in keyword_lists.items():
+        for index, keyword in enumerate(keywords):
+            positions.setdefault(keyword, {})[category] = index
+    return positions
+
+def _build_automaton(keyword_positions: Dict[str, Dict[str, int]]) -> "ahocorasick.Automaton":
+    """Build an automaton whose payload is each keyword with its category positions"""
+    automaton = ahocorasick.Automaton()
+    for keyword, by_category in keyword_positions.items():
+        automaton.add_word(keyword, (keyword, by_category))
+    automaton.make_automaton()
+    return automaton
+
+def _longest_matches(found: List[Tuple[int, int, str]]) -> List[str]:
+    """Distinct keywords of the leftmost-longest non-overlapping (start, -length, keyword) matches"""
+    keywords = []
+    seen = set()
+    last_end = -1
+    for start, neg_length, keyword in sorted(found):
+        if start <= last_end:
+            continue
+        last_end = start - neg_length - 1
+        if keyword not in seen:
+            seen.add(keyword)
+            keywords.append(keyword)
+    return keywords
+
+def _build_patterns(keyword_lists: Dict[str, Tuple[str, ...]]) -> Dict[str, re.Pattern]:
+    """Compile one alternation per category, longest keywords first so they win over their prefixes"""
+    return {
+        category: re.compile("|".join(map(re.escape, sorted(keywords, key=len, reverse=True))))
+        for category, keywords in keyword_lists.items()
+    }
+
+# A single Aho-Corasick automaton over every keyword list, so one pass over a
+# piece of text finds the keywords of all categories at once. Without
+# pyahocorasick, each category gets one regex alternation instead. Built once
+# at import, so every analyzer (and forked worker process) shares them
+_KEYWORD_POSITIONS = _index_keywords(_KEYWORD_LISTS)
+# Categories scored message by message (sentiment and cooperation)
+_MESSAGE_CATEGORIES = ('positive', 'negative', 'coop', 'non_coop')
+if ahocorasick is not None:
+    _AUTOMATON = _build_automaton(_KEYWORD_POSITIONS)
+else:
+    _AUTOMATON = None
+    _PATTERNS = _build_patterns(_KEYWORD_LISTS)
+
+def _risk_score_kernel(sentiment, cooperation, keyword_risk,
+                       user_interruptions, short_fraction, low_confidence_fraction):
+    """Conversation flow risk and overall risk score (0-100), fused into one function"""
+    # Frequent interruptions, mostly very short responses (might indicate
+    # disengagement) and mostly low transcript confidence (might indicate
+    # unclear speech/agitation) each add a fixed amount of flow risk
+    flow_risk = min(100.0,
+                    20.0 * (user_interruptions > 2)
+                    + 15.0 * (short_fraction > 0.7)
+                    + 10.0 * (low_confidence_fraction > 0.5))
+    
+    # Convert sentiment to risk (negative sentiment = higher risk)
+    sentiment_risk = max(0.0, (1.0 - sentiment) * 50.0)  # -1 sentiment = 100 risk, +1 sentiment = 0 risk
+    
+    # Convert cooperation to risk (low cooperation = higher risk)
+    cooperation_risk = 100.0 - cooperation
+    
+    # Weighted average of all factors
+    risk_score = (
+        sentiment_risk * 0.25 +
+        cooperation_risk * 0.35 +
+        keyword_risk * 0.30 +
+        flow_risk * 0.10
+    )
+    
+    return min(100.0, max(0.0, risk_score))
+
+# Importing numba and loading the compiled kernel costs about half a second per
+# run and saves well under a microsecond per transcript, so it only pays off for
+# very large batches. Set RISK_ANALYZER_NUMBA=1 to opt in
+if os.getenv("RISK_ANALYZER_NUMBA") == "1":
+    try:
+        from numba import njit
+    except ImportError:  # keep the plain Python kernel
+        pass
+    else:
+        _risk_score_kernel = njit(cache=True)(_risk_score_kernel)
+
+# Transcripts larger than this are streamed with ijson (when installed) instead
+# of being parsed whole; below it, parsing with orjson is several times faster
+_STREAM_MIN_BYTES = 16 * 1024 * 1024
+
+def _iter_transcript_items(transcript_file: str):
+    """Yield the conversation items of a transcript file one at a time"""
+    with open(transcript_file, 'rb') as f:
+        if ijson is not None and os.fstat(f.fileno()).st_size > _STREAM_MIN_BYTES:
+            # ijson would stream any other root as an empty conversation
+            first = f.read(1)
+            while first.isspace():
+                first = f.read(1)
+            if first != b'{':
+                raise ValueError("transcript root is not a JSON object")
+            f.seek(0)
+            yield from ijson.items(f, 'items.item', use_float=True)
+            return
+        raw = f.read()
+    transcript_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    if not isinstance(transcript_data, dict):
+        raise ValueError("transcript root is not a JSON object")
+    yield from transcript_data.get('items', [])
+
+# Report templates, formatted once per report, summary line or analysis
+_REPORT_HEADER = (
+    "=" * 60 + "\n"
+    + "CUSTOMER RISK ANALYSIS REPORT\n"
+    + "=" * 60 + "\n"
+    + "Generated: {generated}\n"
+    + "Total Transcripts Analyzed: {total}\n"
+    + "\n"
+    + "SUMMARY STATISTICS:\n"
+    + "-" * 20 + "\n"
+)
+_REPORT_LEVEL_LINE = "{level} Risk: {count} ({percentage:.1f}%)\n"
+_REPORT_SUMMARY_FOOTER = (
+    "Average Risk Score: {average:.1f}/100\n"
+    + "\n"
+    + "INDIVIDUAL ANALYSES:\n"
+    + "-" * 20
+)
+_REPORT_ANALYSIS = (
+    "\n\nFile: {file}\n"
+    + "Risk Level: {level}\n"
+    + "Risk Score: {risk_score:.1f}/100\n"
+    + "Sentiment: {sentiment_score:.2f}\n"
+    + "Cooperation: {cooperation_score:.1f}%"
+)
+_REPORT_BULLET = "\n  • {}"
+_REPORT_ANALYSIS_RULE = "\n" + "-" * 40
+
+# Per-directory cache of analyses, keyed by transcript filename
+_ANALYSIS_CACHE_FILENAME = ".risk_analysis_cache.json"
+
+def _analyzer_signature() -> Tuple[int, int]:
+    """Identify this version of the analyzer, so cached analyses are dropped when it changes"""
+    st = os.stat(__file__)
+    return st.st_mtime_ns, st.st_size
+
+def _load_analysis_cache(cache_file: str) -> Dict[str, List[Any]]:
+    """Load the {filename: [mtime_ns, size, analysis dict]} cache, or an empty one if missing or stale"""
+    try:
+        with open(cache_file, 'rb') as f:
+            raw = f.read()
+        signature, entries = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except Exception:
+        return {}
+    if signature != list(_analyzer_signature()) or not isinstance(entries, dict):
+        return {}
+    return entries
+
+def _save_analysis_cache(cache_file: str, entries: Dict[str, List[Any]]) -> None:
+    # write to a temporary file first so an interrupted run never leaves a partial cache
+    tmp_path = f"{cache_file}.{os.getpid()}.tmp"
+    data = [list(_analyzer_signature()), entries]
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data) if orjson is not None else json.dumps(data).encode())
+        os.replace(tmp_path, cache_file)
+    except OSError as e:
+        print(f"Failed to write analysis cache {cache_file}: {e}")
+
+def _cached_analysis(cached: Any, st: os.stat_result, transcript_file: str) -> Optional[RiskAnalysis]:
+    """Rebuild the analysis of a cache entry, or None if the transcript changed or the entry is invalid"""
+    try:
+        mtime_ns, size, fields = cached
+        if (mtime_ns, size) != (st.st_mtime_ns, st.st_size):
+            return None
+        # the directory may have been given by another path since the entry was written
+        return RiskAnalysis(**dict(fields, risk_level=RiskLevel(fields['risk_level']),
+                                   transcript_file=transcript_file))
+    except (TypeError, ValueError, KeyError):
+        return None
+
 class CustomerRiskAnalyzer:
     """Analyze customer risk from debt collection call transcripts"""
     
     def __init__(self):
-        # Risk indicators - keywords that suggest different risk levels
-        # English keywords
-        self.high_risk_keywords = [
-            "can't pay", "no money", "broke", "unemployed", "lost job",
-            "bankruptcy", "lawyer", "dispute", "wrong", "not mine",
-            "never received", "scam", "harassment", "sue", "court",
-            "refuse", "won't pay", "can't afford", "financial hardship",
-            # Hindi keywords (Devanagari)
-            "पैसे नहीं", "पैसा नहीं", "बेरोजगार", "नौकरी नहीं", "गलत", "मेरा नहीं",
-            "नहीं मिला", "धोखा", "गलत नंबर", "वकील", "अदालत", "केस", "मना करता",
-            # Romanized Hindi/Hinglish
-            "paisa nahi", "paise nahi", "berozgar", "naukri nahi", "galat hai",
-            "mera nahi", "nahi mila", "dhoka", "galat number", "vakeel", "adalat",
-            "case karunga", "mana karta", "afford nahi kar sakta", "bankruptcy",
-            "paisa khatam", "financial problem", "court jaaunga", "lawyer se baat"
-        ]
-        
-        self.medium_risk_keywords = [
-            "difficult", "tight", "struggling", "need time", "extension",
-            "payment plan", "partial", "later", "next month", "busy",
-            "forgot", "remind me", "will try", "maybe", "not sure",
-            # Hindi keywords (Devanagari)
-            "मुश्किल", "परेशानी", "समय चाहिए", "भूल गया", "बाद में", "अगले महीने",
-            "व्यस्त", "कोशिश करूंगा", "शायद", "पता नहीं", "थोड़ा समय",
-            # Romanized Hindi/Hinglish
-            "mushkil", "pareshani", "samay chahiye", "bhul gaya", "baad mein",
-            "agle mahine", "vyast", "busy hun", "koshish karunga", "shayad",
-            "pata nahi", "thoda samay", "time chahiye", "extension chahiye",
-            "payment plan", "partial payment", "installment mein", "emi mein"
-        ]
-        
-        self.low_risk_keywords = [
-            "yes", "okay", "sure", "will pay", "today", "tomorrow",
-            "understand", "sorry", "apologize", "thank you", "appreciate",
-            "payment", "pay now", "confirm", "agreed", "right away",
-            # Hindi keywords (Devanagari)
-            "हाँ", "ठीक", "समझ गया", "माफ़ करो", "धन्यवाद", "शुक्रिया", "सही",
-            "आज", "कल", "अभी", "तुरंत", "पेमेंट", "भुगतान", "देता हूँ",
-            # Romanized Hindi/Hinglish
-            "haan", "theek", "theek hai", "samjh gaya", "maaf karo", "dhanyawad",
-            "shukriya", "thank you", "sahi", "aaj", "kal", "abhi", "turant",
-            "payment kar dunga", "paisa de dunga", "bhugtan", "pay kar dunga",
-            "samay pe dunga", "confirm", "agreed", "bilkul", "zaroor"
-        ]
-        
-        self.cooperation_indicators = [
-            "thank you", "sorry", "understand", "appreciate", "yes",
-            "okay", "sure", "will do", "agreed", "right",
-            # Hindi/Hinglish cooperation indicators
-            "haan", "theek", "theek hai", "samjh gaya", "maaf karo", "shukriya",
-            "dhanyawad", "bilkul", "zaroor", "kar dunga", "de dunga", "samjha",
-            "acha", "sahi", "ठीक", "हाँ", "समझ गया", "माफ़ करो", "धन्यवाद",
-            "शुक्रिया", "बिल्कुल", "जरूर", "अच्छा", "सही"
-        ]
-        
-        self.non_cooperation_indicators = [
-            "no", "can't", "won't", "refuse", "busy", "later", "maybe",
-            "not now", "call back", "don't have time", "not interested",
-            # Hindi/Hinglish non-cooperation indicators
-            "nahi", "nahin", "mana", "vyast", "busy", "baad mein", "phone rakh",
-            "time nahi", "interested nahi", "pareshaan mat karo", "tang mat karo",
-            "नहीं", "मना", "व्यस्त", "बाद में", "फोन रख", "समय नहीं", "परेशान मत करो",
-            "तंग मत करो", "call back", "later call karo", "abhi nahi"
-        ]
+        # The keyword lists are module-level constants shared by every instance
+        self.high_risk_keywords = _KEYWORD_LISTS['high']
+        self.medium_risk_keywords = _KEYWORD_LISTS['medium']
+        self.low_risk_keywords = _KEYWORD_LISTS['low']
+        self.cooperation_indicators = _KEYWORD_LISTS['coop']
+        self.non_cooperation_indicators = _KEYWORD_LISTS['non_coop']
+        self.positive_words = _KEYWORD_LISTS['positive']
+        self.negative_words = _KEYWORD_LISTS['negative']
+        self.evasive_phrases = _KEYWORD_LISTS['evasive']
+        self.hostile_phrases = _KEYWORD_LISTS['hostile']
+        self.distress_phrases = _KEYWORD_LISTS['distress']
+
+    def _match_keywords(self, content: str) -> Dict[str, List[int]]:
+        """Scan content once and return, per category, the list positions of the keywords it contains
+        
+        Within a category the longest match wins: a keyword that only occurs as
+        part of a longer keyword of the same category (e.g. "theek" inside
+        "theek hai") is not counted separately.
+        """
+        hits = {category: [] for category in _KEYWORD_LISTS}
+        if _AUTOMATON is None:
+            for category, pattern in _PATTERNS.items():
+                for keyword in set(pattern.findall(content)):
+                    hits[category].append(_KEYWORD_POSITIONS[keyword][category])
+            return hits
+        
+        # The automaton reports overlapping matches, so per category keep the
+        # leftmost-longest non-overlapping ones, as the regex alternation does
+        matches = {category: [] for category in _KEYWORD_LISTS}
+        for end, (keyword, by_category) in _AUTOMATON.iter(content):
+            match = (end - len(keyword) + 1, -len(keyword), keyword)
+            for category in by_category:
+                matches[category].append(match)
+        
+        for category, found in matches.items():
+            hits[category] = [_KEYWORD_POSITIONS[keyword][category] for keyword in _longest_matches(found)]
+        return hits
+
+    def _match_transcript(self, contents: List[str],
+                          all_content: str) -> Tuple[Dict[str, List[int]], Dict[str, np.ndarray]]:
+        """Match keywords over the joined user content and within each message
+        
+        Returns the transcript-wide hits (as _match_keywords) and, for the
+        per-message categories, the number of distinct keywords in every message.
+        """
+        message_counts = {category: np.zeros(len(contents), dtype=np.int32) for category in _MESSAGE_CATEGORIES}
+        if _AUTOMATON is None:
+            for i, content in enumerate(contents):
+                message_hits = self._match_keywords(content)
+                for category, counts in message_counts.items():
+                    counts[i] = len(message_hits[category])
+            return self._match_keywords(all_content), message_counts
+        
+        # One sweep over the joined content. The automaton reports every
+        # occurrence, so a match lying inside a single message (found by
+        # bisecting the message start offsets) is exactly what scanning that
+        # message alone would report; matches spanning two messages only count
+        # transcript-wide
+        starts = []
+        offset = 0
+        for content in contents:
+            starts.append(offset)
+            offset += len(content) + 1
+        
+        matches = {category: [] for category in _KEYWORD_LISTS}
+        per_message = {category: {} for category in _MESSAGE_CATEGORIES}
+        for end, (keyword, by_category) in _AUTOMATON.iter(all_content):
+            match = (end - len(keyword) + 1, -len(keyword), keyword)
+            i = bisect_right(starts, match[0]) - 1
+            within_message = end < starts[i] + len(contents[i])
+            for category in by_category:
+                matches[category].append(match)
+                if within_message and category in per_message:
+                    per_message[category].setdefault(i, []).append(match)
+        
+        hits = {
+            category: [_KEYWORD_POSITIONS[keyword][category] for keyword in _longest_matches(found)]
+            for category, found in matches.items()
+        }
+        for category, by_message in per_message.items():
+            counts = message_counts[category]
+            for i, found in by_message.items():
+                counts[i] = len(_longest_matches(found))
+        return hits, message_counts
 
     def analyze_transcript(self, transcript_file: str) -> RiskAnalysis:
         """Analyze a single transcript file and return risk assessment"""
         
+        # Collect user messages (only these are analyzed) as parallel arrays,
+        # projecting each conversation item as it is parsed
+        contents = []
+        wordsets = []
+        interrupted = []
+        confidence = []
+        token_counts = []
+        
         try:
-            with open(transcript_file, 'r', encoding='utf-8') as f:
-                transcript_data = json.load(f)
+            for item in _iter_transcript_items(transcript_file):
+                if item.get('type') == 'message' and item.get('role') == 'user':
+                    content = _normalize_text(' '.join(item.get('content', [])))
+                    tokens = content.split()
+                    contents.append(content)
+                    wordsets.append(frozenset(_LATIN_WORD.findall(content)))
+                    interrupted.append(bool(item.get('interrupted', False)))
+                    confidence.append(item.get('transcript_confidence', 1.0))
+                    token_counts.append(len(tokens))
         except Exception as e:
             raise ValueError(f"Error reading transcript file {transcript_file}: {e}")
         
-        # Extract conversation items
-        items = transcript_data.get('items', [])
-        
-        # Separate user and assistant messages
-        user_messages = []
-        assistant_messages = []
-        
-        for item in items:
-            if item.get('type') == 'message':
-                content = ' '.join(item.get('content', [])).lower()
-                if item.get('role') == 'user':
-                    user_messages.append({
-                        'content': content,
-                        'interrupted': item.get('interrupted', False),
-                        'confidence': item.get('transcript_confidence', 1.0)
-                    })
-                elif item.get('role') == 'assistant':
-                    assistant_messages.append({
-                        'content': content,
-                        'interrupted': item.get('interrupted', False)
-                    })
+        user_messages = UserMessages(
+            contents=contents,
+            wordsets=wordsets,
+            interrupted=np.array(interrupted, dtype=bool),
+            confidence=np.array(confidence, dtype=np.float64),
+            token_counts=np.array(token_counts, dtype=np.int32),
+        )
+        
+        # Scan the user's content once, for the transcript-wide keywords and the
+        # per-message counts behind sentiment and cooperation. The analyzers
+        # below only do arithmetic on these
+        all_content = ' '.join(contents)
+        hits, message_counts = self._match_transcript(contents, all_content)
         
         # Perform analysis
-        sentiment_score = self._analyze_sentiment(user_messages)
-        cooperation_score = self._analyze_cooperation(user_messages)
-        keyword_risk_score = self._analyze_keywords(user_messages)
-        conversation_flow_score = self._analyze_conversation_flow(user_messages, assistant_messages)
+        sentiment_score = self._analyze_sentiment(message_counts)
+        cooperation_score = self._analyze_cooperation(message_counts)
+        keyword_risk_score = self._analyze_keywords(hits)
+        conversation_flow = self._analyze_conversation_flow(user_messages)
         
         # Calculate overall risk score (0-100)
         risk_score = self._calculate_risk_score(
-            sentiment_score, cooperation_score, keyword_risk_score, conversation_flow_score
+            sentiment_score, cooperation_score, keyword_risk_score, conversation_flow
         )
         
         # Determine risk level
         risk_level = self._determine_risk_level(risk_score)
         
         # Identify key indicators
-        key_indicators = self._identify_key_indicators(user_messages)
+        key_indicators = self._identify_key_indicators(user_messages, hits)
         
         # Generate recommendations
         recommendations = self._generate_recommendations(risk_level, key_indicators, cooperation_score)
@@ -175,75 +600,28 @@ class CustomerRiskAnalyzer:
             analysis_timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         )
 
-    def _analyze_sentiment(self, user_messages: List[Dict]) -> float:
+    def _analyze_sentiment(self, message_counts: Dict[str, np.ndarray]) -> float:
         """Analyze sentiment of user messages (-1 to 1, where -1 is very negative)"""
-        if not user_messages:
+        positive_counts = message_counts['positive']
+        negative_counts = message_counts['negative']
+        
+        # Average the sentiment of the messages containing any sentiment words
+        totals = positive_counts + negative_counts
+        scored = totals > 0
+        message_count = int(scored.sum())
+        if message_count == 0:
             return 0.0
         
-        total_sentiment = 0.0
-        message_count = 0
-        
-        # Enhanced sentiment analysis for Hindi/Hinglish
-        positive_words = [
-            # English positive words
-            "thank", "sorry", "appreciate", "understand", "yes", "okay", "good", "fine",
-            "great", "excellent", "wonderful", "happy", "pleased", "satisfied",
-            # Hindi/Hinglish positive words (Romanized)
-            "dhanyawad", "shukriya", "maaf karo", "samjh gaya", "theek", "acha", "badhiya",
-            "khushi", "santushti", "prasanna", "haan", "bilkul", "zaroor", "accha",
-            "sahi", "badiya", "mast", "sundar", "samjha", "theek hai",
-            # Hindi positive words (Devanagari)
-            "धन्यवाद", "शुक्रिया", "माफ़ करो", "समझ गया", "ठीक", "अच्छा", "बढ़िया",
-            "खुशी", "संतुष्टि", "प्रसन्न", "हाँ", "बिल्कुल", "जरूर", "सही"
-        ]
-        
-        negative_words = [
-            # English negative words
-            "no", "can't", "won't", "angry", "upset", "wrong", "bad", "hate", "refuse",
-            "terrible", "awful", "horrible", "disgusted", "furious", "annoyed",
-            # Hindi/Hinglish negative words (Romanized)
-            "nahi", "nahin", "gussa", "pareshaan", "galat", "bura", "nafrat", "mana",
-            "tang", "irritate", "problem", "mushkil", "takleef", "dukh", "ghussa",
-            "pareshan", "khafa", "chid", "badtameez", "bakwas",
-            # Hindi negative words (Devanagari)
-            "नहीं", "गुस्सा", "परेशान", "गलत", "बुरा", "नफरत", "मना", "तंग",
-            "समस्या", "मुश्किल", "तकलीफ", "दुःख", "खफा", "चिढ़", "बदतमीज", "बकवास"
-        ]
-        
-        for msg in user_messages:
-            content = msg['content']
-            positive_count = sum(1 for word in positive_words if word in content)
-            negative_count = sum(1 for word in negative_words if word in content)
-            
-            if positive_count > 0 or negative_count > 0:
-                msg_sentiment = (positive_count - negative_count) / max(positive_count + negative_count, 1)
-                total_sentiment += msg_sentiment
-                message_count += 1
-        
-        return total_sentiment / max(message_count, 1)
+        msg_sentiment = (positive_counts[scored] - negative_counts[scored]) / totals[scored]
+        return float(msg_sentiment.sum()) / message_count
 
-    def _analyze_cooperation(self, user_messages: List[Dict]) -> float:
+    def _analyze_cooperation(self, message_counts: Dict[str, np.ndarray]) -> float:
         """Analyze cooperation level (0-100)"""
-        if not user_messages:
-            return 50.0
+        cooperation_count = int(message_counts['coop'].sum())
+        non_cooperation_count = int(message_counts['non_coop'].sum())
         
-        cooperation_points = 0
-        total_indicators = 0
-        
-        for msg in user_messages:
-            content = msg['content']
-            
-            # Check for cooperation indicators
-            for indicator in self.cooperation_indicators:
-                if indicator in content:
-                    cooperation_points += 1
-                    total_indicators += 1
-            
-            # Check for non-cooperation indicators
-            for indicator in self.non_cooperation_indicators:
-                if indicator in content:
-                    cooperation_points -= 1
-                    total_indicators += 1
+        cooperation_points = cooperation_count - non_cooperation_count
+        total_indicators = cooperation_count + non_cooperation_count
         
         if total_indicators == 0:
             return 50.0  # Neutral if no clear indicators
@@ -252,16 +630,11 @@ class CustomerRiskAnalyzer:
         cooperation_ratio = cooperation_points / total_indicators
         return max(0, min(100, 50 + (cooperation_ratio * 50)))
 
-    def _analyze_keywords(self, user_messages: List[Dict]) -> float:
+    def _analyze_keywords(self, hits: Dict[str, List[int]]) -> float:
         """Analyze risk based on keywords (0-100, higher = more risk)"""
-        if not user_messages:
-            return 0.0
-        
-        all_content = ' '.join(msg['content'] for msg in user_messages)
-        
-        high_risk_count = sum(1 for keyword in self.high_risk_keywords if keyword in all_content)
-        medium_risk_count = sum(1 for keyword in self.medium_risk_keywords if keyword in all_content)
-        low_risk_count = sum(1 for keyword in self.low_risk_keywords if keyword in all_content)
+        high_risk_count = len(hits['high'])
+        medium_risk_count = len(hits['medium'])
+        low_risk_count = len(hits['low'])
         
         # Calculate weighted risk score
         risk_score = (high_risk_count * 30) + (medium_risk_count * 15) - (low_risk_count * 10)
@@ -269,54 +642,22 @@ class CustomerRiskAnalyzer:
         # Normalize to 0-100 scale
         return max(0, min(100, risk_score))
 
-    def _analyze_conversation_flow(self, user_messages: List[Dict], assistant_messages: List[Dict]) -> float:
-        """Analyze conversation flow patterns (0-100, higher = more risk)"""
-        risk_score = 0.0
-        
-        # Check if user interrupted agent frequently
-        user_interruptions = sum(1 for msg in user_messages if msg.get('interrupted', False))
-        if user_interruptions > 2:
-            risk_score += 20
-        
-        # Check if user responses are very short (might indicate disengagement)
-        short_responses = sum(1 for msg in user_messages if len(msg['content'].split()) <= 2)
-        if len(user_messages) > 0 and short_responses / len(user_messages) > 0.7:
-            risk_score += 15
-        
-        # Check transcript confidence (low confidence might indicate unclear speech/agitation)
-        low_confidence_count = sum(1 for msg in user_messages 
-                                 if msg.get('confidence', 1.0) < 0.7)
-        if len(user_messages) > 0 and low_confidence_count / len(user_messages) > 0.5:
-            risk_score += 10
+    def _analyze_conversation_flow(self, user_messages: UserMessages) -> Tuple[int, float, float]:
+        """Summarize conversation flow: interruptions, short-response and low-confidence fractions"""
+        if len(user_messages) == 0:
+            return 0, 0.0, 0.0
         
-        return min(100, risk_score)
+        return (
+            int(user_messages.interrupted.sum()),
+            float((user_messages.token_counts <= 2).mean()),
+            float((user_messages.confidence < 0.7).mean()),
+        )
 
     def _calculate_risk_score(self, sentiment: float, cooperation: float, 
-                            keyword_risk: float, flow_risk: float) -> float:
+                            keyword_risk: float, flow: Tuple[int, float, float]) -> float:
         """Calculate overall risk score (0-100)"""
-        
-        # Convert sentiment to risk (negative sentiment = higher risk)
-        sentiment_risk = max(0, (1 - sentiment) * 50)  # -1 sentiment = 100 risk, +1 sentiment = 0 risk
-        
-        # Convert cooperation to risk (low cooperation = higher risk)
-        cooperation_risk = 100 - cooperation
-        
-        # Weighted average of all factors
-        weights = {
-            'sentiment': 0.25,
-            'cooperation': 0.35,
-            'keywords': 0.30,
-            'flow': 0.10
-        }
-        
-        risk_score = (
-            sentiment_risk * weights['sentiment'] +
-            cooperation_risk * weights['cooperation'] +
-            keyword_risk * weights['keywords'] +
-            flow_risk * weights['flow']
-        )
-        
-        return min(100, max(0, risk_score))
+        # cast once so the compiled kernel only ever sees one signature
+        return float(_risk_score_kernel(float(sentiment), float(cooperation), float(keyword_risk), *flow))
 
     def _determine_risk_level(self, risk_score: float) -> RiskLevel:
         """Determine risk level based on score"""
@@ -329,31 +670,25 @@ class CustomerRiskAnalyzer:
         else:
             return RiskLevel.LOW
 
-    def _identify_key_indicators(self, user_messages: List[Dict]) -> List[str]:
+    def _identify_key_indicators(self, user_messages: UserMessages, hits: Dict[str, List[int]]) -> List[str]:
         """Identify key risk indicators found in the conversation"""
         indicators = []
-        all_content = ' '.join(msg['content'] for msg in user_messages)
         
         # Check for specific indicators
-        for keyword in self.high_risk_keywords:
-            if keyword in all_content:
-                # Translate common Hindi phrases for better reporting
-                translated_keyword = self._translate_keyword_for_report(keyword)
-                indicators.append(f"High risk keyword: '{translated_keyword}'")
+        for index in sorted(hits['high']):
+            indicators.append(f"High risk keyword: '{_REPORT_NAMES['high'][index]}'")
         
-        for keyword in self.medium_risk_keywords:
-            if keyword in all_content:
-                translated_keyword = self._translate_keyword_for_report(keyword)
-                indicators.append(f"Medium risk keyword: '{translated_keyword}'")
+        for index in sorted(hits['medium']):
+            indicators.append(f"Medium risk keyword: '{_REPORT_NAMES['medium'][index]}'")
         
         # Check for Hinglish-specific patterns
-        hinglish_patterns = self._detect_hinglish_patterns(all_content)
+        hinglish_patterns = self._detect_hinglish_patterns(hits)
         indicators.extend(hinglish_patterns)
         
         # Check for patterns
         if len(user_messages) == 0:
             indicators.append("No user responses - possible call avoidance")
-        elif len(user_messages) == 1 and len(user_messages[0]['content'].split()) <= 2:
+        elif len(user_messages) == 1 and user_messages.token_counts[0] <= 2:
             indicators.append("Very brief response - possible disengagement")
         
         # Check for language switching patterns (risk indicator in debt collection)
@@ -362,105 +697,38 @@ class CustomerRiskAnalyzer:
         
         return indicators[:7]  # Increased limit for more detailed analysis
     
-    def _translate_keyword_for_report(self, keyword: str) -> str:
-        """Translate Hindi keywords to English for better report readability"""
-        translations = {
-            # Hindi to English translations for reporting
-            "पैसे नहीं": "no money",
-            "पैसा नहीं": "no money", 
-            "बेरोजगार": "unemployed",
-            "नौकरी नहीं": "no job",
-            "गलत": "wrong",
-            "मेरा नहीं": "not mine",
-            "नहीं मिला": "never received",
-            "धोखा": "fraud/scam",
-            "वकील": "lawyer",
-            "अदालत": "court",
-            "केस": "case",
-            "मुश्किल": "difficult",
-            "परेशानी": "problem/trouble",
-            "समय चाहिए": "need time",
-            "भूल गया": "forgot",
-            "बाद में": "later",
-            "व्यस्त": "busy",
-            "हाँ": "yes",
-            "ठीक": "okay",
-            "समझ गया": "understood",
-            "माफ़ करो": "sorry",
-            "धन्यवाद": "thank you",
-            "शुक्रिया": "thank you",
-            "नहीं": "no",
-            "गुस्सा": "angry",
-            "परेशान": "upset/troubled"
-        }
-        return translations.get(keyword, keyword)
-    
-    def _detect_hinglish_patterns(self, content: str) -> List[str]:
+    def _detect_hinglish_patterns(self, hits: Dict[str, List[int]]) -> List[str]:
         """Detect specific Hinglish patterns that might indicate risk"""
         patterns = []
         
-        # Common evasive Hinglish phrases
-        evasive_phrases = [
-            "abhi busy hun", "time nahi hai", "baad mein call karo", 
-            "pareshaan mat karo", "tang mat karo", "galat number hai",
-            "mujhe pata nahi", "kuch nahi pata", "samjh nahi aaya"
-        ]
-        
-        for phrase in evasive_phrases:
-            if phrase in content:
-                patterns.append(f"Evasive Hinglish phrase: '{phrase}'")
-        
-        # Aggressive/hostile Hinglish patterns
-        hostile_phrases = [
-            "phone rakh", "bakwas mat karo", "jhooth bol rahe ho",
-            "scam hai ye", "fraud company", "police complaint karunga"
-        ]
-        
-        for phrase in hostile_phrases:
-            if phrase in content:
-                patterns.append(f"Hostile Hinglish phrase: '{phrase}'")
-        
-        # Financial distress Hinglish indicators
-        distress_phrases = [
-            "paisa nahi hai", "afford nahi kar sakta", "salary nahi aayi",
-            "job chali gayi", "business band ho gaya", "EMI bhi nahi de pa raha"
-        ]
-        
-        for phrase in distress_phrases:
-            if phrase in content:
-                patterns.append(f"Financial distress indicator: '{phrase}'")
+        for index in sorted(hits['evasive']):
+            patterns.append(f"Evasive Hinglish phrase: '{self.evasive_phrases[index]}'")
+        
+        for index in sorted(hits['hostile']):
+            patterns.append(f"Hostile Hinglish phrase: '{self.hostile_phrases[index]}'")
+        
+        for index in sorted(hits['distress']):
+            patterns.append(f"Financial distress indicator: '{self.distress_phrases[index]}'")
         
         return patterns
     
-    def _detect_language_switching(self, user_messages: List[Dict]) -> bool:
+    def _detect_language_switching(self, user_messages: UserMessages) -> bool:
         """Detect if user frequently switches between Hindi and English"""
         if len(user_messages) < 3:
             return False
         
-        # Simple heuristic: check if messages alternate between having Hindi and English words
-        hindi_indicators = ["nahi", "hai", "kar", "se", "mein", "ko", "ka", "ki", "ke"]
-        english_indicators = ["the", "and", "is", "are", "can", "will", "have", "not"]
-        
-        language_pattern = []
-        for msg in user_messages:
-            content = msg['content']
-            hindi_count = sum(1 for word in hindi_indicators if word in content)
-            english_count = sum(1 for word in english_indicators if word in content)
-            
-            if hindi_count > english_count:
-                language_pattern.append('H')  # Hindi dominant
-            elif english_count > hindi_count:
-                language_pattern.append('E')  # English dominant
-            else:
-                language_pattern.append('M')  # Mixed or neutral
+        # Simple heuristic: check if messages alternate between having Hindi and English words.
+        # Label each message 1 (Hindi dominant), -1 (English dominant) or 0 (mixed or neutral)
+        n = len(user_messages)
+        labels = np.sign(np.fromiter(
+            (len(wordset & _HINDI_WORDS) - len(wordset & _ENGLISH_WORDS) for wordset in user_messages.wordsets),
+            dtype=np.int8, count=n,
+        ))
         
-        # Check for frequent switching (more than 50% of transitions are switches)
-        switches = 0
-        for i in range(len(language_pattern) - 1):
-            if language_pattern[i] != language_pattern[i + 1] and language_pattern[i] != 'M' and language_pattern[i + 1] != 'M':
-                switches += 1
+        # A switch is a Hindi/English transition; transitions touching a mixed message are not counted
+        switches = int((labels[:-1] * labels[1:] == -1).sum())
         
-        return switches > len(language_pattern) * 0.3  # More than 30% switches
+        return switches > n * 0.3  # More than 30% switches
 
     def _generate_recommendations(self, risk_level: RiskLevel, indicators: List[str], 
                                 cooperation_score: float) -> List[str]:
@@ -535,21 +803,78 @@ class CustomerRiskAnalyzer:
         
         return recommendations
 
-    def analyze_all_transcripts(self, transcript_dir: str = "transcripts") -> List[RiskAnalysis]:
-        """Analyze all transcript files in the directory"""
+    def _try_analyze_transcript(self, transcript_file: str) -> Tuple[Optional[RiskAnalysis], Optional[str]]:
+        """Analyze one transcript, returning the error message instead of raising"""
+        try:
+            return self.analyze_transcript(transcript_file), None
+        except Exception as e:
+            return None, str(e)
+
+    def analyze_all_transcripts(self, transcript_dir: str = "transcripts",
+                                max_workers: Optional[int] = None,
+                                use_cache: bool = True) -> List[RiskAnalysis]:
+        """Analyze all transcript files in the directory, in parallel worker processes
+        
+        With use_cache, analyses are kept in a cache file inside the directory
+        and reused while a transcript's modification time and size are unchanged.
+        """
         if not os.path.exists(transcript_dir):
             raise ValueError(f"Transcript directory '{transcript_dir}' does not exist")
         
         analyses = []
-        transcript_files = [f for f in os.listdir(transcript_dir) if f.endswith('.json')]
+        with os.scandir(transcript_dir) as it:
+            entries = [
+                entry for entry in it
+                if entry.name.endswith('.json') and entry.name != _ANALYSIS_CACHE_FILENAME and entry.is_file()
+            ]
+        transcript_files = [entry.name for entry in entries]
+        
+        cache_file = os.path.join(transcript_dir, _ANALYSIS_CACHE_FILENAME)
+        cache = _load_analysis_cache(cache_file) if use_cache else {}
+        new_cache = {}
+        results = {}
+        pending = []
+        for entry in entries:
+            filename, filepath = entry.name, entry.path
+            st = entry.stat()
+            cached = cache.get(filename)
+            analysis = _cached_analysis(cached, st, filepath) if cached is not None else None
+            if analysis is not None:
+                results[filename] = (analysis, None)
+                new_cache[filename] = cached
+            else:
+                pending.append((filename, filepath, st))
+        
+        # Transcripts are independent and the analysis is CPU-bound Python code,
+        # so spread them over processes (threads would serialize on the GIL).
+        # max_workers defaults to the CPU count; 1 analyzes in this process
+        # no more workers than transcripts, and about four chunks per worker
+        # so every worker gets some and stragglers even out
+        pending_paths = [filepath for _, filepath, _ in pending]
+        workers = min(max_workers or os.cpu_count() or 1, len(pending_paths))
+        if workers <= 1:
+            fresh = list(map(self._try_analyze_transcript, pending_paths))
+        else:
+            chunksize = max(1, len(pending_paths) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                fresh = list(executor.map(self._try_analyze_transcript, pending_paths, chunksize=chunksize))
+        
+        for (filename, _, st), (analysis, error) in zip(pending, fresh):
+            results[filename] = (analysis, error)
+            if error is None:
+                fields = dict(asdict(analysis), risk_level=analysis.risk_level.value)
+                new_cache[filename] = [st.st_mtime_ns, st.st_size, fields]
+        
+        # Rewrite the cache only when something was analyzed or a transcript went away
+        if use_cache and (pending or new_cache.keys() != cache.keys()):
+            _save_analysis_cache(cache_file, new_cache)
         
         for filename in transcript_files:
-            filepath = os.path.join(transcript_dir, filename)
-            try:
-                analysis = self.analyze_transcript(filepath)
+            analysis, error = results[filename]
+            if error is not None:
+                print(f"Error analyzing {filename}: {error}")
+            else:
                 analyses.append(analysis)
-            except Exception as e:
-                print(f"Error analyzing {filename}: {e}")
         
         return analyses
 
@@ -558,57 +883,44 @@ class CustomerRiskAnalyzer:
         if not analyses:
             return "No analyses to report"
         
-        report = []
-        report.append("=" * 60)
-        report.append("CUSTOMER RISK ANALYSIS REPORT")
-        report.append("=" * 60)
-        report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append(f"Total Transcripts Analyzed: {len(analyses)}")
-        report.append("")
+        report = io.StringIO()
         
         # Summary statistics
-        risk_counts = {level: 0 for level in RiskLevel}
-        total_risk_score = 0
-        
-        for analysis in analyses:
-            risk_counts[analysis.risk_level] += 1
-            total_risk_score += analysis.risk_score
+        risk_counts = Counter(analysis.risk_level for analysis in analyses)
+        avg_risk_score = sum(analysis.risk_score for analysis in analyses) / len(analyses)
         
-        avg_risk_score = total_risk_score / len(analyses)
-        
-        report.append("SUMMARY STATISTICS:")
-        report.append("-" * 20)
+        report.write(_REPORT_HEADER.format(
+            generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'), total=len(analyses)
+        ))
         for level in RiskLevel:
             count = risk_counts[level]
             percentage = (count / len(analyses)) * 100
-            report.append(f"{level.value} Risk: {count} ({percentage:.1f}%)")
-        report.append(f"Average Risk Score: {avg_risk_score:.1f}/100")
-        report.append("")
+            report.write(_REPORT_LEVEL_LINE.format(level=level.value, count=count, percentage=percentage))
+        report.write(_REPORT_SUMMARY_FOOTER.format(average=avg_risk_score))
         
         # Individual analyses
-        report.append("INDIVIDUAL ANALYSES:")
-        report.append("-" * 20)
-        
         for analysis in sorted(analyses, key=lambda x: x.risk_score, reverse=True):
-            report.append(f"\nFile: {os.path.basename(analysis.transcript_file)}")
-            report.append(f"Risk Level: {analysis.risk_level.value}")
-            report.append(f"Risk Score: {analysis.risk_score:.1f}/100")
-            report.append(f"Sentiment: {analysis.sentiment_score:.2f}")
-            report.append(f"Cooperation: {analysis.cooperation_score:.1f}%")
+            report.write(_REPORT_ANALYSIS.format(
+                file=os.path.basename(analysis.transcript_file),
+                level=analysis.risk_level.value,
+                risk_score=analysis.risk_score,
+                sentiment_score=analysis.sentiment_score,
+                cooperation_score=analysis.cooperation_score,
+            ))
             
             if analysis.key_indicators:
-                report.append("Key Indicators:")
+                report.write("\nKey Indicators:")
                 for indicator in analysis.key_indicators:
-                    report.append(f"  • {indicator}")
+                    report.write(_REPORT_BULLET.format(indicator))
             
             if analysis.recommendations:
-                report.append("Recommendations:")
+                report.write("\nRecommendations:")
                 for rec in analysis.recommendations:
-                    report.append(f"  • {rec}")
+                    report.write(_REPORT_BULLET.format(rec))
             
-            report.append("-" * 40)
+            report.write(_REPORT_ANALYSIS_RULE)
         
-        report_text = "\n".join(report)
+        report_text = report.getvalue()
         
         if output_file:
             with open(output_file, 'w', encoding='utf-8') as f:
@@ -641,9 +953,7 @@ def main():
         print("RISK ANALYSIS SUMMARY")
         print("=" * 50)
         
-        risk_counts = {level: 0 for level in RiskLevel}
-        for analysis in analyses:
-            risk_counts[analysis.risk_level] += 1
+        risk_counts = Counter(analysis.risk_level for analysis in analyses)
         
         for level in RiskLevel:
             count = risk_counts[level]